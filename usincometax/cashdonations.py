@@ -20,11 +20,15 @@ from argparse import ArgumentParser
 import csv
 import sys
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Mapping
 from typing import Sequence
 import taxexchangeformat
 
+# Buffer size for reading input files, larger than the io.DEFAULT_BUFFER_SIZE of 8 KiB.
+_IO_BUFFER_SIZE = 1 << 18
+
 def _replace_dates(rows: Sequence[Mapping[str, str]]) -> None:
     # Replace the date in each row with 'Various'.
     for row in rows:
@@ -35,37 +39,29 @@ def _map_rows_to_payees(rows: Sequence[Mapping[str, str]]) -> Dict[str, List[Dic
     # Return a mapping of payees to rows.
     rows_for_payees = {}
     for row in rows:
-        payee = row['Payee']
-        if payee is not None and payee not in rows_for_payees:
-            rows_for_payees[payee] = []
-        rows_for_payees[payee].append(row)
+        rows_for_payees.setdefault(row['Payee'], []).append(row)
     return rows_for_payees
 
 def _replace_different_dates(rows_for_payees: Mapping[str, Sequence[Mapping[str, str]]]) -> None:
     # Determine if there are multiple dates for a payee; if true, replace those dates with
     # 'Various'.
-    for payee in list(rows_for_payees):
-        payee_rows = rows_for_payees[payee]
-        if len(payee_rows) > 1:
-            last_date = payee_rows[-1]['Date']
-            for payee_row in payee_rows:
-                if payee_row['Date'] != last_date:
-                    _replace_dates(payee_rows)
-                    break
+    for payee_rows in rows_for_payees.values():
+        other_payee_rows = iter(payee_rows)
+        first_date = next(other_payee_rows)['Date']
+        if any(payee_row['Date'] != first_date for payee_row in other_payee_rows):
+            _replace_dates(payee_rows)
     return
 
 def read_cash_donations(csv_filename: str, replace_dates: bool) -> List[Dict[str, str]]:
     """Read cash donations from CSV file."""
-    rows = []
-    with open(csv_filename, newline='') as csvfile:
-        reader = csv.DictReader(csvfile)
-        rows.extend(reader)
+    with open(csv_filename, newline='', buffering=_IO_BUFFER_SIZE) as csvfile:
+        rows = list(csv.DictReader(csvfile))
     if replace_dates:
         rows_for_payees = _map_rows_to_payees(rows)
         _replace_different_dates(rows_for_payees)
     return rows
 
-def write_txf_records(rows: Sequence[Mapping[str, str]], omit_header: bool) -> None:
+def write_txf_records(rows: Iterable[Mapping[str, str]], omit_header: bool) -> None:
     """Write cash donations to console as TXF records."""
     if not omit_header:
         taxexchangeformat.write_header('usincometax 2020.0.0')
@@ -85,8 +81,13 @@ def write_txf_records(rows: Sequence[Mapping[str, str]], omit_header: bool) -> N
 
 def csv_to_txf(csv_filename: str, replace_dates: bool, omit_header: bool) -> None:
     """Read cash donations from a CSV file and write TXF records to the console."""
-    rows = read_cash_donations(csv_filename, replace_dates)
-    write_txf_records(rows, omit_header)
+    if replace_dates:
+        # Replacing dates needs every row for a payee, so read all of the rows first.
+        rows = read_cash_donations(csv_filename, replace_dates)
+        write_txf_records(rows, omit_header)
+        return
+    with open(csv_filename, newline='', buffering=_IO_BUFFER_SIZE) as csvfile:
+        write_txf_records(csv.DictReader(csvfile), omit_header)
     return
 
 def main() -> None:
@@ -22,59 +22,86 @@ The requirements of the CSV file are as follows:
 
 from argparse import ArgumentParser
 import csv
+from itertools import chain
 import sys
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Mapping
-from typing import Sequence
 import taxexchangeformat
 
+# Buffer size for reading input files, larger than the io.DEFAULT_BUFFER_SIZE of 8 KiB.
+_IO_BUFFER_SIZE = 1 << 18
+
 def read_tax_payments(csv_filename: str) -> List[Dict[str, str]]:
     """Read quarterly estimated tax payments from CSV file."""
-    rows = []
-    with open(csv_filename, newline='') as csvfile:
-        reader = csv.DictReader(csvfile)
-        rows.extend(reader)
+    with open(csv_filename, newline='', buffering=_IO_BUFFER_SIZE) as csvfile:
+        rows = list(csv.DictReader(csvfile))
     return rows
 
-def write_txf_records(rows: Sequence[Mapping[str, str]], omit_header: bool) -> None:
+def _write_federal_est_tax_payment(row: Mapping[str, str]) -> None:
+    # Write a TXF detail record for a federal tax payment row.
+    taxexchangeformat.write_federal_est_tax_payment(
+        row['Date'],
+        row['Amount'],
+        row.get('Account', ''),
+        row.get('Check Number', ''),
+        row.get('Payee', ''),
+        row.get('Memo', ''),
+        row.get('Category', ''))
+    return
+
+def _write_federal_est_tax_summary(row: Mapping[str, str]) -> None:
+    # Write a TXF summary record for the federal tax payments total row.
+    taxexchangeformat.write_federal_est_tax_summary(row['Amount'])
+    return
+
+def _write_state_est_tax_payment(row: Mapping[str, str]) -> None:
+    # Write a TXF detail record for a state tax payment row.
+    taxexchangeformat.write_state_est_tax_payment(
+        row['Date'],
+        row['Amount'],
+        row['State'],
+        row.get('Account', ''),
+        row.get('Check Number', ''),
+        row.get('Payee', ''),
+        row.get('Memo', ''),
+        row.get('Category', ''))
+    return
+
+def _write_state_est_tax_summary(row: Mapping[str, str]) -> None:
+    # Write a TXF summary record for the state tax payments total row.
+    taxexchangeformat.write_state_est_tax_summary(row['Amount'], row['State'])
+    return
+
+def write_txf_records(rows: Iterable[Mapping[str, str]], omit_header: bool) -> None:
     """Write quarterly estimated tax payments to console as TXF records."""
     if not omit_header:
         taxexchangeformat.write_header('usincometax 2020.0.0')
-    if rows[0].get('State') is None:
-        for row in rows:
-            if row['Date'] == '':
-                taxexchangeformat.write_federal_est_tax_summary(row['Amount'])
-            else:
-                taxexchangeformat.write_federal_est_tax_payment(
-                    row['Date'],
-                    row['Amount'],
-                    row.get('Account', ''),
-                    row.get('Check Number', ''),
-                    row.get('Payee', ''),
-                    row.get('Memo', ''),
-                    row.get('Category', ''))
+    # Peek at the first row to determine if the tax payments are federal or state.
+    row_iterator = iter(rows)
+    first_row = next(row_iterator, None)
+    if first_row is None:
+        return
+    rows = chain([first_row], row_iterator)
+    if first_row.get('State') is None:
+        write_payment = _write_federal_est_tax_payment
+        write_summary = _write_federal_est_tax_summary
     else:
-        for row in rows:
-            if row['Date'] == '':
-                taxexchangeformat.write_state_est_tax_summary(row['Amount'], row['State'])
-            else:
-                taxexchangeformat.write_state_est_tax_payment(
-                    row['Date'],
-                    row['Amount'],
-                    row['State'],
-                    row.get('Account', ''),
-                    row.get('Check Number', ''),
-                    row.get('Payee', ''),
-                    row.get('Memo', ''),
-                    row.get('Category', ''))
+        write_payment = _write_state_est_tax_payment
+        write_summary = _write_state_est_tax_summary
+    for row in rows:
+        if row['Date'] == '':
+            write_summary(row)
+        else:
+            write_payment(row)
     return
 
 def csv_to_txf(csv_filename: str, omit_header: bool) -> None:
     """Read quarterly estimated tax payments from a CSV file and write TXF records to the console.
     """
-    rows = read_tax_payments(csv_filename)
-    write_txf_records(rows, omit_header)
+    with open(csv_filename, newline='', buffering=_IO_BUFFER_SIZE) as csvfile:
+        write_txf_records(csv.DictReader(csvfile), omit_header)
     return
 
 def main() -> None:
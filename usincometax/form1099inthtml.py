@@ -7,10 +7,32 @@ and write the data to the console in Tax Exchange Format (TXF).
 """
 
 from argparse    import ArgumentParser
+import codecs
+from html        import unescape
 from html.parser import HTMLParser
+import mmap
+import os
+import re
+import stat
 import sys
+from typing      import Optional
+from typing      import Tuple
 import taxexchangeformat
 
+# Buffer size for reading input files, larger than the io.DEFAULT_BUFFER_SIZE of 8 KiB.
+_IO_BUFFER_SIZE = 1 << 18
+
+# Number of bytes to decode and feed to the HTML parser at a time.
+_PARSER_CHUNK_SIZE = 1 << 16
+
+# Patterns that match the text of a Treasury Direct Form 1099-INT page in a single scan.
+_PAYER_NAME_PATTERN = re.compile(rb'>Payer Information:<.*?>([^<]+)<', re.DOTALL)
+_TOTALS_PATTERN = re.compile(rb'>Form 1099-INT.*?>Totals:<.*?>(\$[^<]*)<.*?>(\$[^<]*)<', re.DOTALL)
+
+def _decode(data: bytes) -> str:
+    # Decode matched bytes the same way the HTML parser would see them.
+    return unescape(data.decode('windows-1252'))
+
 class TreasuryDirectHtmlParser(HTMLParser):
     """HTML parser for Treasury Direct Form 1099-INT."""
     box_3 = None
@@ -30,32 +52,37 @@ class TreasuryDirectHtmlParser(HTMLParser):
             return True
         return False
 
+    def _handle_form(self, data: str) -> None:
+        if data.startswith('Form 1099-INT'):
+            self.found_1099_int = True
+        return
+
     def _handle_totals(self, data: str) -> None:
         if data == "Totals:" and self.found_1099_int:
             self.found_1099_int_totals = True
-            return
+        return
+
+    def _handle_amount(self, data: str) -> None:
         if self.found_1099_int_totals:
             if self.box_3 is None:
-                if data.startswith('$'):
-                    self.box_3 = data
-                    return
-            if self.box_4 is None:
-                if data.startswith('$'):
-                    self.box_4 = data
-                    self.done = True
-                    return
+                self.box_3 = data
+                return
+            self.box_4 = data
+            self.done = True
         return
 
+    # Data handlers keyed on the first character of the data that they can match.
+    _data_handlers = {'F': _handle_form, 'T': _handle_totals, '$': _handle_amount}
+
     def handle_data(self, data: str) -> None:
         """Cache relevant data."""
         if self.done:
             return
         if self._handle_payer(data):
             return
-        if data.startswith('Form 1099-INT'):
-            self.found_1099_int = True
-            return
-        self._handle_totals(data)
+        handler = self._data_handlers.get(data[:1])
+        if handler is not None:
+            handler(self, data)
         return
 
     def get_payer_name(self) -> str:
@@ -70,23 +97,52 @@ class TreasuryDirectHtmlParser(HTMLParser):
         """Return the federal tax withheld from box 4."""
         return self.box_4
 
-def parse_file(filename: str, parser: TreasuryDirectHtmlParser) -> None:
-    """Parse the HTML file and cache extracted within the parser."""
-    with open(filename, mode='r', encoding='windows-1252') as html_file:
-        data = html_file.read()
-        parser.feed(data)
-    return
+def parse_file(filename: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Return the payer name, box 3 data, and box 4 data extracted from the HTML file."""
+    with open(filename, mode='rb', buffering=_IO_BUFFER_SIZE) as html_file:
+        file_status = os.fstat(html_file.fileno())
+        # Search a memory map of a non-empty regular file so that the whole page is not copied
+        # into memory; other files, such as pipes, cannot be memory-mapped.
+        if stat.S_ISREG(file_status.st_mode) and file_status.st_size > 0:
+            with mmap.mmap(html_file.fileno(), 0, access=mmap.ACCESS_READ) as html_data:
+                payer_name_match = _PAYER_NAME_PATTERN.search(html_data)
+                totals_match = _TOTALS_PATTERN.search(html_data)
+                if payer_name_match is not None and totals_match is not None:
+                    return (
+                        _decode(payer_name_match.group(1)).strip(),
+                        _decode(totals_match.group(1)),
+                        _decode(totals_match.group(2)))
+        # Fall back to the HTML parser if the file is not memory-mapped or the page does not match
+        # the patterns; decode the page incrementally and stop reading once the parser has found
+        # all of the data.
+        parser = TreasuryDirectHtmlParser()
+        reader = codecs.getreader('windows-1252')(html_file)
+        unfed_data = ''
+        while not parser.done:
+            data = reader.read(_PARSER_CHUNK_SIZE)
+            if not data:
+                break
+            # Hold back the data from the last tag onward; the parser handles text at the end of
+            # what it has been fed, so feeding a partial run of text would split the text.
+            data = unfed_data + data
+            tag_start = max(data.rfind('<'), 0)
+            parser.feed(data[:tag_start])
+            unfed_data = data[tag_start:]
+        parser.feed(unfed_data)
+        parser.close()
+    return (
+        parser.get_payer_name(),
+        parser.get_savings_bonds_interest(),
+        parser.get_federal_tax_withheld())
 
 def html_to_txf(filename: str, omit_header: bool) -> None:
     """Read interest income data from an HTML file and write TXF records to the console."""
-    html_parser = TreasuryDirectHtmlParser()
-    parse_file(filename, html_parser)
+    payer_name, box_3, box_4 = parse_file(filename)
+    if payer_name is None:
+        raise ValueError('payer name')
     if not omit_header:
         taxexchangeformat.write_header('usincometax 2020.0.0')
-    taxexchangeformat.write_1099int(
-        payer=html_parser.get_payer_name(),
-        box_3=html_parser.get_savings_bonds_interest(),
-        box_4=html_parser.get_federal_tax_withheld())
+    taxexchangeformat.write_1099int(payer=payer_name, box_3=box_3, box_4=box_4)
     return
 
 def main() -> None:
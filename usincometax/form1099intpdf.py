@@ -6,95 +6,89 @@ Extract Payer Name and Box 1 data from a Form 1099-INT PDF file and write the da
 console in Tax Exchange Format (TXF). The 1099-INT PDF must have the same layout as the
 Form 1099-INT, Copy B For Recipient, at https://www.irs.gov/pub/irs-pdf/f1099int.pdf.
 """
-# TODO switch to the pdfminer high-level extract_pages API after upgrading
-# pdfminer.six dependency to version 20200720 or higher
 
-from argparse           import ArgumentParser
+from argparse            import ArgumentParser
 import sys
-from typing             import List
-from typing             import Optional
-from typing             import Sequence
-from pdfminer.converter import PDFPageAggregator
-from pdfminer.layout    import LAParams
-from pdfminer.layout    import LTTextBoxHorizontal
-from pdfminer.pdfinterp import PDFPageInterpreter
-from pdfminer.pdfinterp import PDFResourceManager
-from pdfminer.pdfpage   import PDFPage
+from typing              import List
+from typing              import Optional
+from typing              import Sequence
+from pdfminer.high_level import extract_pages
+from pdfminer.layout     import LAParams
+from pdfminer.layout     import LTTextBoxHorizontal
 import taxexchangeformat
 
+# Buffer size for reading input files, larger than the io.DEFAULT_BUFFER_SIZE of 8 KiB.
+_IO_BUFFER_SIZE = 1 << 18
+
+_layout_analysis_params = LAParams(char_margin=1.4, line_margin=0.01)
+
 def get_text_boxes(filename: str, page: int = 1) -> List[LTTextBoxHorizontal]:
     """Return the horizontal text boxes on the PDF page."""
-    resource_manager = PDFResourceManager(caching=True)
-    layout_analysis_params = LAParams(char_margin=1.4, line_margin=0.01)
-    device = PDFPageAggregator(resource_manager, laparams=layout_analysis_params)
-    interpreter = PDFPageInterpreter(resource_manager, device)
-    with open(filename, mode='rb') as pdf_file:
-        page_generator = PDFPage.get_pages(
-            pdf_file,
-            pagenos=[page-1],
-            maxpages=1,
-            check_extractable=False)
-        for pdf_page in page_generator:
-            interpreter.process_page(pdf_page)
-            layout_page = device.get_result()
-            text_boxes = []
-            for child in layout_page:
-                if isinstance(child, LTTextBoxHorizontal):
-                    text_boxes.append(child)
-    return text_boxes
+    with open(filename, mode='rb', buffering=_IO_BUFFER_SIZE) as pdf_file:
+        for layout_page in extract_pages(
+                pdf_file, page_numbers=[page-1], maxpages=1, laparams=_layout_analysis_params):
+            return [child for child in layout_page if isinstance(child, LTTextBoxHorizontal)]
+    return []
 
-def _get_form_text_box(
-        text_boxes: Sequence[LTTextBoxHorizontal], with_text: str) -> LTTextBoxHorizontal:
+def _get_form_text_boxes(
+        text_boxes: Sequence[LTTextBoxHorizontal], *with_texts: str) -> List[LTTextBoxHorizontal]:
+    # Return the first text box with each of the texts, scanning the text boxes only once.
+    form_text_boxes = dict.fromkeys(with_texts)
     for text_box in text_boxes:
-        if text_box.get_text() == with_text:
-            return text_box
-    raise ValueError(with_text)
-
-def _is_east(text_box: LTTextBoxHorizontal, text_box_e: LTTextBoxHorizontal) -> bool:
-    """Return True if the left edge of text_box_e is east of the right edge of text_box."""
-    return text_box_e.x0 > text_box.x1
-
-def _is_northwest(text_box: LTTextBoxHorizontal, text_box_nw: LTTextBoxHorizontal) -> bool:
-    """Return True if the left edge of text_box_nw is west of the left edge of text_box and the
-    bottom edge of text_box_nw is north of the top edge of text_box.
-    """
-    return text_box_nw.x0 < text_box.x0 and text_box_nw.y0 > text_box.y1
-
-def _is_south(text_box: LTTextBoxHorizontal, text_box_s: LTTextBoxHorizontal) -> bool:
-    """Return True if the top edge of text_box_s is south of the bottom edge of text_box."""
-    return text_box_s.y1 < text_box.y0
+        text = text_box.get_text()
+        if text in form_text_boxes and form_text_boxes[text] is None:
+            form_text_boxes[text] = text_box
+    for with_text, form_text_box in form_text_boxes.items():
+        if form_text_box is None:
+            raise ValueError(with_text)
+    return list(form_text_boxes.values())
 
 def _get_trimmed_text(text_box: LTTextBoxHorizontal) -> str:
     return text_box.get_text().rstrip('\n')
 
-def find_payer_name_data(text_boxes: Sequence[LTTextBoxHorizontal]) -> Optional[str]:
-    """Return the payer name or None if not found."""
-    form_text_box_northwest = _get_form_text_box(
-        text_boxes,
-        with_text='or foreign postal code, and telephone no.\n')
-    form_text_box_south = _get_form_text_box(text_boxes, with_text='PAYER’S TIN\n')
-    form_text_box_east = _get_form_text_box(text_boxes, with_text='10 Market discount\n')
+def _find_text_in_region(
+        text_boxes: Sequence[LTTextBoxHorizontal], form_text_box_northwest: LTTextBoxHorizontal,
+        form_text_box_south: LTTextBoxHorizontal,
+        form_text_box_east: LTTextBoxHorizontal) -> Optional[str]:
+    """Return the text of the first text box that is southeast of form_text_box_northwest, north
+    of form_text_box_south, and west of form_text_box_east or None if not found.
+    """
+    west_edge = form_text_box_northwest.x0
+    north_edge = form_text_box_northwest.y0
+    south_edge = form_text_box_south.y1
+    east_edge = form_text_box_east.x0
     for text_box in text_boxes:
-        if _is_northwest(text_box, form_text_box_northwest) and\
-            _is_south(text_box, form_text_box_south) and _is_east(text_box, form_text_box_east):
+        if text_box.x0 > west_edge and text_box.y1 < north_edge and\
+            text_box.y0 > south_edge and text_box.x1 < east_edge:
             return _get_trimmed_text(text_box)
     return None
 
+def find_payer_name_data(text_boxes: Sequence[LTTextBoxHorizontal]) -> Optional[str]:
+    """Return the payer name or None if not found."""
+    form_text_box_northwest, form_text_box_south, form_text_box_east = _get_form_text_boxes(
+        text_boxes,
+        'or foreign postal code, and telephone no.\n',
+        'PAYER’S TIN\n',
+        '10 Market discount\n')
+    return _find_text_in_region(
+        text_boxes, form_text_box_northwest, form_text_box_south, form_text_box_east)
+
 def find_box_1_data(text_boxes: Sequence[LTTextBoxHorizontal]) -> Optional[str]:
     """Return the interest income from box 1 or None if not found."""
-    form_text_box_northwest = _get_form_text_box(text_boxes, with_text='1 Interest income\n')
-    form_text_box_south = _get_form_text_box(text_boxes, with_text='2 Early withdrawal penalty\n')
-    form_text_box_east = _get_form_text_box(text_boxes, with_text='11 Bond premium\n')
-    for text_box in text_boxes:
-        if _is_northwest(text_box, form_text_box_northwest) and\
-            _is_south(text_box, form_text_box_south) and _is_east(text_box, form_text_box_east):
-            return _get_trimmed_text(text_box)
-    return None
+    form_text_box_northwest, form_text_box_south, form_text_box_east = _get_form_text_boxes(
+        text_boxes,
+        '1 Interest income\n',
+        '2 Early withdrawal penalty\n',
+        '11 Bond premium\n')
+    return _find_text_in_region(
+        text_boxes, form_text_box_northwest, form_text_box_south, form_text_box_east)
 
 def pdf_to_txf(filename: str, omit_header: bool) -> None:
     """Read interest income data from a PDF file and write TXF records to the console."""
     text_boxes = get_text_boxes(filename)
     payer_name = find_payer_name_data(text_boxes)
+    if payer_name is None:
+        raise ValueError('payer name')
     interest_income = find_box_1_data(text_boxes)
     if not omit_header:
         taxexchangeformat.write_header('usincometax 2020.0.0')
@@ -1,16 +1,35 @@
 """Write tax data to the console in Tax Exchange Format (TXF)."""
 
 import datetime
+import sys
 from typing import Optional
 
-def _txf_write(*obj: str) -> None:
-    # Write objects to the console with the recommended TXF line terminator.
-    print(*obj, end='\r\n')
+# Bound formatter for the detail line of cash donations and estimated tax payments.
+_txf_format_detail = '{:10.10} {:30.30} {:6.6} {:40.40}{:40.40} {:.15}'.format
+
+# Translation table that removes any '$' or ',' or '-' characters from an amount.
+_txf_amount_table = str.maketrans('', '', '$,-')
+
+# Date of the TXF header, which is the date that the records are written.
+_txf_today = datetime.date.today().strftime('%m/%d/%Y')
+
+# Templates for whole TXF records, with the recommended TXF line terminator after each line.
+_txf_header = 'V042\r\nA%s\r\nD%s\r\n^\r\n'
+_txf_record_format_1_summary = 'TS\r\nN%d\r\nC%d\r\nL%d\r\n$%s\r\n^\r\n'
+_txf_record_format_1_detail = 'TD\r\nN%d\r\nC%d\r\nL%d\r\n$%s\r\nX%s\r\n^\r\n'
+_txf_record_format_3_summary = 'TS\r\nN%d\r\nC%d\r\nL%d\r\n$%s\r\nP%s\r\n^\r\n'
+_txf_record_format_3_detail = 'TD\r\nN%d\r\nC%d\r\nL%d\r\n$%s\r\nP%s\r\nX%s\r\n^\r\n'
+_txf_record_format_6_summary = 'TS\r\nN%d\r\nC%d\r\nL%d\r\nD%s\r\n$%s\r\nP%s\r\n^\r\n'
+_txf_record_format_6_detail = 'TD\r\nN%d\r\nC%d\r\nL%d\r\nD%s\r\n$%s\r\nP%s\r\nX%s\r\n^\r\n'
+
+def _txf_write(record: str) -> None:
+    # Write a record to the console in a single call.
+    sys.stdout.write(record)
     return
 
 def _txf_normalize_amount(amount: str) -> str:
     # Remove any '$' or ',' or '-' characters from the amount.
-    amount = amount.translate({36: None, 44: None, 45: None})
+    amount = amount.translate(_txf_amount_table)
     return '0' + amount if amount.startswith('.') else amount
 
 def _txf_expense(amount: str) -> str:
@@ -26,56 +45,46 @@ def _txf_write_record_format_1(
         amount: str, ref_num: int,
         copy: int = 1, line: int = 1, detail: Optional[str] = None) -> None:
     # Write a Record Format 1 TXF record.
-    _txf_write('TS' if detail is None else 'TD')
-    _txf_write(f'N{ref_num}')
-    _txf_write(f'C{copy}')
-    _txf_write(f'L{line}')
-    _txf_write('$' + amount)
-    if detail is not None:
-        _txf_write('X' + detail)
-    _txf_write('^')
+    if detail is None:
+        _txf_write(_txf_record_format_1_summary % (ref_num, copy, line, amount))
+    else:
+        _txf_write(_txf_record_format_1_detail % (ref_num, copy, line, amount, detail))
     return
 
 def _txf_write_record_format_3(
         amount: str, description: str, ref_num: int,
         copy: int = 1, line: int = 1, detail: Optional[str] = None) -> None:
     # Write a Record Format 3 TXF record.
-    _txf_write('TS' if detail is None else 'TD')
-    _txf_write(f'N{ref_num}')
-    _txf_write(f'C{copy}')
-    _txf_write(f'L{line}')
-    _txf_write('$' + amount)
-    _txf_write('P' + description)
-    if detail is not None:
-        _txf_write('X' + detail)
-    _txf_write('^')
+    if description is None:
+        raise ValueError('description')
+    if detail is None:
+        _txf_write(_txf_record_format_3_summary % (ref_num, copy, line, amount, description))
+    else:
+        _txf_write(
+            _txf_record_format_3_detail % (ref_num, copy, line, amount, description, detail))
     return
 
 def _txf_write_record_format_6(
         date: str, amount: str, state: str, ref_num: int, copy: int = 1,
         line: int = 1, detail: Optional[str] = None) -> None:
     # Write a Record Format 6 TXF record.
-    _txf_write('TS' if detail is None else 'TD')
-    _txf_write(f'N{ref_num}')
-    _txf_write(f'C{copy}')
-    _txf_write(f'L{line}')
-    _txf_write('D' + date)
-    _txf_write('$' + amount)
-    _txf_write('P' + state)
-    if detail is not None:
-        _txf_write('X' + detail)
-    _txf_write('^')
+    if state is None:
+        raise ValueError('state')
+    if detail is None:
+        _txf_write(_txf_record_format_6_summary % (ref_num, copy, line, date, amount, state))
+    else:
+        _txf_write(
+            _txf_record_format_6_detail % (ref_num, copy, line, date, amount, state, detail))
     return
 
 def write_header(program: str) -> None:
     """Write a TXF header."""
-    _txf_write('V042')
-    _txf_write('A' + program)
-    _txf_write('D' + datetime.date.today().strftime('%m/%d/%Y'))
-    _txf_write('^')
+    _txf_write(_txf_header % (program, _txf_today))
     return
 
-def write_1099int(payer: str, box_1: str = None, box_3: str = None, box_4: str = None) -> None:
+def write_1099int(
+        payer: str, box_1: Optional[str] = None, box_3: Optional[str] = None,
+        box_4: Optional[str] = None) -> None:
     """Write TXF records for a Form 1099-INT."""
     if box_1 is not None:
         _txf_write_record_format_3(_txf_income(box_1), payer, 287)
@@ -90,12 +99,11 @@ def write_cash_donation(
         category: str) -> None:
     """Write a TXF detail record for a cash donation."""
     # Ensure that a category is present so that TurboTax will parse the detail line correctly.
-    if category.lstrip() == '':
+    if not category or category.isspace():
         category = 'Cash donation'
     _txf_write_record_format_1(
         _txf_expense(amount), 280,
-        detail=f'{date:10.10} {account:30.30} {check_number:6.6} {payee:40.40}'\
-            f'{memo:40.40} {category:.15}')
+        detail=_txf_format_detail(date, account, check_number, payee, memo, category))
     return
 
 def write_cash_donations_summary(amount: str) -> None:
@@ -108,12 +116,11 @@ def write_federal_est_tax_payment(
         category: str) -> None:
     """Write a TXF detail record for a federal quarterly estimated tax payment."""
     # Ensure that a category is present so that TurboTax will parse the detail line correctly.
-    if category.lstrip() == '':
+    if not category or category.isspace():
         category = 'Fed qtr est tax'
     _txf_write_record_format_6(
         date, _txf_expense(amount), 'XX', 521,
-        detail=f'{date:10.10} {account:30.30} {check_number:6.6} {payee:40.40}'\
-            f'{memo:40.40} {category:.15}')
+        detail=_txf_format_detail(date, account, check_number, payee, memo, category))
     return
 
 def write_federal_est_tax_summary(amount: str) -> None:
@@ -126,12 +133,11 @@ def write_state_est_tax_payment(
         memo: str, category: str) -> None:
     """Write a TXF detail record for a state quarterly estimated tax payment."""
     # Ensure that a category is present so that TurboTax will parse the detail line correctly.
-    if category.lstrip() == '':
+    if not category or category.isspace():
         category = 'Sta qtr est tax'
     _txf_write_record_format_6(
         date, _txf_expense(amount), state, 522,
-        detail=f'{date:10.10} {account:30.30} {check_number:6.6} {payee:40.40}'\
-            f'{memo:40.40} {category:.15}')
+        detail=_txf_format_detail(date, account, check_number, payee, memo, category))
     return
 
 def write_state_est_tax_summary(amount: str, state: str) -> None: